@@ -34,243 +34,388 @@ Revision History:
     - Changed to use a temporary directory for storing STL previews, which are deleted after execution.
     - Added progress bar using tqdm for better user feedback during STL file processing.
     - Adding retries to create_3d_preview() to make it more stable, as the backend pyglet can fail occasionally.
+
+- v3.0.0 (2026-10-15): Performance improvements
+    - Render STL previews in parallel across all CPU cores using a multiprocessing pool.
+    - Render previews headless with pyrender's offscreen renderer instead of pyglet windows, removing the retries.
+    - Reuse one offscreen renderer and scene per worker process instead of creating them for every file.
+    - Save previews as JPEG instead of PNG to reduce the size of the Excel file.
+    - Write the Excel file with XlsxWriter in constant memory mode instead of openpyxl.
+    - Embed the previews straight from memory, no temporary directory is used anymore.
+    - Write log messages to the log file as they happen, using the logging module.
 -------------------------------------------------------------------------------
 """
 
 import os
 import sys
+
+# Render offscreen through EGL on Linux so no window (or display) is needed. This has to be set
+# before pyrender/PyOpenGL are imported; on Windows and macOS pyrender uses a hidden pyglet context.
+if sys.platform.startswith("linux"):
+    os.environ.setdefault("PYOPENGL_PLATFORM", "egl")
+
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from multiprocessing import Pool, Queue
+from multiprocessing.util import Finalize
 from pathlib import Path
-import tempfile
-import shutil
+from io import BytesIO
+import numpy as np
+import pyrender
 import trimesh
-from openpyxl import Workbook
-from openpyxl.drawing.image import Image
-from openpyxl.styles import Font
+import xlsxwriter
+from PIL import Image
 from tqdm import tqdm
 from datetime import datetime
-import time
-
-# Create logs directory if it doesn't exist
-logs_dir = Path("logs")
-logs_dir.mkdir(exist_ok=True)
-
-# Check if the user provided the STL directory as a command-line argument
-if len(sys.argv) > 1:
-    stls_dir = Path(sys.argv[1])
-else:
-    # Prompt the user to enter the path if not provided
-    stls_dir = Path(input("Please enter the path to the folder containing the STL files: "))
-
-# Check if the provided path is valid
-if not stls_dir.is_dir():
-    print(f"The specified path '{stls_dir}' is not a valid directory. Exiting.")
-    sys.exit(1)
-
-# Set up a temporary directory for the STL previews
-temp_dir = Path(tempfile.mkdtemp())
-log_messages = []  # List to collect log messages
-log_messages.append(f"Using temporary directory for previews: {temp_dir}")
-
-# Gather all STL files in the specified 'Stls' directory and its subdirectories
-stl_files = []
-for root, _, files in os.walk(stls_dir):
-    for file in files:
-        if file.lower().endswith('.stl'):
-            full_path = Path(root) / file
-            stl_files.append(full_path)
-
-log_messages.append(f"Found {len(stl_files)} STL files in '{stls_dir}'.")
-print(f"Processing {len(stl_files)} STL files...")
-
-def create_3d_preview(stl_file_path, save_path, image_size=(200, 200), max_retries=10):
+
+# Camera field of view (x, y) in degrees, matching trimesh's default scene camera
+CAMERA_FOV = (60.0, 45.0)
+
+# Meshes with more triangles than this are decimated before rendering, as a thumbnail cannot show more detail
+MAX_PREVIEW_FACES = 10000
+
+# Cell format properties, each added to the workbook once and shared by all cells using it
+BOLD = {'bold': True}
+RED_BOLD = {'bold': True, 'font_color': '#FF0000'}
+
+# Row heights for rows with and without a preview, other rows keep Excel's default height
+PREVIEW_ROW_HEIGHT = 150
+MISSING_ROW_HEIGHT = 20
+
+# Offscreen renderer and scene of the current process, created on first use and reused for every file
+_RENDERER = None
+_SCENE = None
+_CAMERA_NODE = None
+_LIGHT_NODE = None
+
+# Whether fast-simplification can be imported for decimation, checked on first use in the current process
+_CAN_DECIMATE = None
+
+
+def _can_decimate():
+    """Check once per process whether meshes can be decimated, warning if fast-simplification cannot be imported."""
+    global _CAN_DECIMATE
+    if _CAN_DECIMATE is None:
+        try:
+            import fast_simplification  # noqa: F401
+            _CAN_DECIMATE = True
+        except ImportError as e:
+            _CAN_DECIMATE = False
+            logging.warning(f"fast-simplification cannot be imported ({e}), large meshes are rendered without decimation")
+    return _CAN_DECIMATE
+
+
+def _init_renderer(image_size):
+    """
+    Create the offscreen renderer and the reusable scene for the current process.
+
+    The GL context is set up once per worker process instead of once per STL file. Only the mesh
+    node and the camera and light poses change between files.
+    """
+    global _RENDERER, _SCENE, _CAMERA_NODE, _LIGHT_NODE
+    _RENDERER = pyrender.OffscreenRenderer(*image_size)
+    # Release the GL context when the process exits (atexit hooks do not run in pool workers)
+    Finalize(None, _RENDERER.delete, exitpriority=10)
+
+    # Set ambient lighting and background color for better contrast, with a light at the camera
+    _SCENE = pyrender.Scene(
+        bg_color=[240, 240, 240, 255],  # Light background
+        ambient_light=[0.5, 0.5, 0.5],  # Brighter ambient light
+    )
+    _CAMERA_NODE = _SCENE.add(pyrender.PerspectiveCamera(yfov=np.radians(CAMERA_FOV[1])))
+    _LIGHT_NODE = _SCENE.add(pyrender.DirectionalLight(color=[1.0, 1.0, 1.0], intensity=3.0))
+
+
+def create_3d_preview(stl_file_path, image_size=(200, 200)):
     """
     Generate a 3D preview image for an STL file with auto-scaling and color coding.
     
-    The function attempts to create a 3D preview image of the given STL file. It applies color coding 
-    based on the file name, calculates the optimal camera settings for the preview, and saves the 
-    rendered image to the specified path. It includes a retry mechanism to handle transient failures 
-    during the rendering process.
+    The function creates a 3D preview image of the given STL file. It applies color coding based on
+    the file name, calculates the optimal camera settings for the preview, renders the model with the
+    offscreen renderer of the current process and returns the encoded JPEG image. Writing the image is
+    left to the caller, so a worker process only spends its time on rendering.
     
     Args:
         stl_file_path (Path): The file path to the STL file.
-        save_path (Path): The path where the generated preview image will be saved.
         image_size (tuple): The resolution of the output image as (width, height). Default is (200, 200).
-        max_retries (int): The maximum number of retry attempts if an error occurs during rendering. 
-                           Default is 10.
     
     Returns:
-        bool: True if the preview was successfully created, False if all retries failed.
+        tuple: (stl_file_path, jpeg_bytes), where jpeg_bytes is the JPEG encoded preview or None if the
+               preview could not be created.
     
     Raises:
-        ZeroDivisionError: If a division by zero occurs during rendering (handled internally).
-        Exception: Any other unexpected errors during rendering are logged but do not raise exceptions.
+        Exception: Any errors while loading or rendering are logged but do not raise exceptions.
     
     Notes:
         - The function applies color coding to the mesh based on the presence of '[a]' or '[c]' in the 
           file name: red for '[a]', white for '[c]', and black for all other files.
         - The camera parameters are set to provide an optimal view of the model, with auto-scaling 
           based on the model's dimensions.
-        - If the image rendering fails due to a ZeroDivisionError (likely caused by a window size 
-          calculation issue), the function retries up to 'max_retries' times.
+        - Rendering is headless (EGL on Linux), so no window is opened and no retries are needed.
     """
-    retries = 0
-    while retries < max_retries:
-        try:
-            mesh = trimesh.load_mesh(stl_file_path)
-            scene = mesh.scene()
-
-            # Apply color based on file name condition
-            if '[a]' in stl_file_path.name.lower():
-                mesh.visual.face_colors = [180, 0, 0, 255]  # Mild red
-            elif '[c]' in stl_file_path.name.lower():
-                mesh.visual.face_colors = [255, 255, 255, 255]  # White
-            else:
-                mesh.visual.face_colors = [50, 50, 50, 255]  # Mild black
-
-            # Calculate optimal camera distance to fit the entire model
-            bounding_box = mesh.bounding_box_oriented.bounds
-            scale = max(bounding_box[1] - bounding_box[0])  # Size of the model's longest axis
-            camera_distance = scale * 2.5  # Adjust zoom level based on model size
-
-            # Ensure width and height are non-zero for aspect ratio calculation
-            width, height = image_size
-            if height == 0:
-                height = 1
-
-            # Set the camera parameters explicitly
-            scene.set_camera(
-                angles=[0.7, -0.3, 0.3],  # Front-top angle
-                distance=camera_distance,
-                center=mesh.centroid,  # Center the view on the model
-            )
-
-            # Set ambient lighting and background color for better contrast
-            scene.ambient_light = [0.5, 0.5, 0.5, 1.0]  # Brighter ambient light
-            scene.background = [240, 240, 240, 255]  # Light background
-
-            # Save the image with suppressed preview display
-            image = scene.save_image(resolution=image_size, visible=True)
-            with open(save_path, 'wb') as f:
-                f.write(image)
-            
-            return True
-        except ZeroDivisionError as e:
-            log_messages.append(f"ZeroDivisionError encountered when creating preview for {stl_file_path}: {e}")
-            retries += 1
-        except Exception as e:
-            log_messages.append(f"Error creating preview for {stl_file_path}: {e}")
-            return False
-    # If all retries fail
-    log_messages.append(f"Failed to create preview for {stl_file_path} after {max_retries} retries.")
-    return False
-
-# Initialize Excel workbook
-wb = Workbook()
-ws = wb.active
-ws.title = "STL Checklist"
-
-# List to track missing previews
-missing_previews = []
-
-# Set headers
-ws.append(["Filename", "Preview", "Checked and Available", "Not Needed"])
-
-# Adjust column widths
-ws.column_dimensions['A'].width = 30
-ws.column_dimensions['B'].width = 30
-ws.column_dimensions['C'].width = 20
-ws.column_dimensions['D'].width = 15
-
-# Make headers bold
-for cell in ws[1]:
-    cell.font = Font(bold=True)
-
-# Track the current folder to add section headers
-current_folder = None
-
-# Process each STL file with a progress bar
-for stl_path in tqdm(sorted(stl_files), desc="Processing STL files", unit="file"):
-    # Determine the folder structure relative to 'Stls' directory
-    folder = stl_path.parent.relative_to(stls_dir)
-    
-    # Add a new header for each folder if it changes
-    if folder != current_folder:
-        # Insert a blank row for spacing before new folder
-        ws.append([""])
-        
-        # Add folder header row
-        folder_row = ws.max_row + 1
-        ws.append([f"Folder: {folder}"])
-        ws[f"A{folder_row}"].font = Font(bold=True)
-        
-        current_folder = folder
-
-    # Generate preview image path
-    preview_path = temp_dir / f"{stl_path.name}.png"
-
-    # Generate and save preview image
-    if create_3d_preview(stl_path, preview_path):
-        # Add filename and placeholders for checkboxes
-        row = [
-            stl_path.name,
-            "",  # Placeholder for the image
-            "",  # Placeholder for "Checked and Available"
-            "",  # Placeholder for "Not Needed"
-        ]
-        ws.append(row)
-        
-        # Insert preview image into the Excel sheet
-        img = Image(str(preview_path))
-        img.width, img.height = 200, 200  # Resize image to 200x200 pixels
-        img_cell = f"B{ws.max_row}"  # Column B, current row
-        ws.add_image(img, img_cell)
-        
-        # Set the row height to 150 for rows with images
-        ws.row_dimensions[ws.max_row].height = 150
+    mesh_node = None
+    try:
+        if _RENDERER is None:
+            _init_renderer(image_size)
+
+        # Load without processing (vertex merging, cleanup), which a thumbnail does not need
+        mesh = trimesh.load_mesh(str(stl_file_path), process=False, validate=False)
+        if isinstance(mesh, trimesh.Scene):
+            # Multi-body STLs load as a scene, so combine the bodies into one mesh
+            mesh = trimesh.util.concatenate(tuple(mesh.geometry.values()))
+
+        # Fail fast on files without any triangles, there is nothing to size the camera on or render
+        if len(mesh.faces) == 0:
+            logging.error(f"Error creating preview for {stl_file_path}: the STL file contains no triangles")
+            return stl_file_path, None
+
+        # Decimate large meshes, merging the unprocessed STL vertices first so edges can collapse
+        if len(mesh.faces) > MAX_PREVIEW_FACES and _can_decimate():
+            mesh.merge_vertices()
+            mesh = mesh.simplify_quadric_decimation(face_count=MAX_PREVIEW_FACES)
+
+        # Apply color based on file name condition
+        name_lower = stl_file_path.name.lower()
+        if '[a]' in name_lower:
+            mesh.visual.face_colors = [180, 0, 0, 255]  # Mild red
+        elif '[c]' in name_lower:
+            mesh.visual.face_colors = [255, 255, 255, 255]  # White
+        else:
+            mesh.visual.face_colors = [50, 50, 50, 255]  # Mild black
+
+        # Calculate optimal camera distance to fit the entire model
+        scale = float(mesh.extents.max()) or 1.0  # Longest axis of the cached AABB, 1.0 for degenerate meshes
+        camera_distance = scale * 2.5  # Adjust zoom level based on model size
+
+        # Set the camera parameters explicitly, the same way trimesh's Scene.set_camera does
+        camera_pose = trimesh.scene.cameras.look_at(
+            mesh.bounds,
+            fov=CAMERA_FOV,
+            rotation=trimesh.transformations.euler_matrix(0.7, -0.3, 0.3),  # Front-top angle
+            distance=camera_distance,
+            center=mesh.centroid,  # Center the view on the model
+        )
+
+        # Swap the model into the shared scene and point the camera and light at it
+        mesh_node = _SCENE.add(pyrender.Mesh.from_trimesh(mesh, smooth=False))  # Flat shading keeps face colors
+        _SCENE.set_pose(_CAMERA_NODE, camera_pose)
+        _SCENE.set_pose(_LIGHT_NODE, camera_pose)
+
+        # Render offscreen and encode the image
+        _RENDERER.viewport_width, _RENDERER.viewport_height = image_size
+        color, _ = _RENDERER.render(_SCENE, flags=pyrender.RenderFlags.RGBA)
+        # Map the bottom-up pixel buffer read back from GL without copying it: RGBA pixels are used as
+        # RGBX, which the JPEG encoder accepts directly, and orientation -1 flips the rows
+        frame = np.ascontiguousarray(np.flip(color, axis=0))
+        image = Image.frombuffer('RGBX', image_size, frame, 'raw', 'RGBX', 0, -1)
+        image_buffer = BytesIO()
+        # JPEG keeps the embedded thumbnails (and the xlsx) several times smaller than PNG
+        image.save(image_buffer, format='JPEG', quality=80)
+
+        return stl_file_path, image_buffer.getvalue()
+    except Exception as e:
+        logging.error(f"Error creating preview for {stl_file_path}: {e}")
+        return stl_file_path, None
+    finally:
+        # Remove the model again so the scene is ready for the next file
+        if mesh_node is not None:
+            _SCENE.remove_node(mesh_node)
+
+
+def iter_stl_files(root):
+    """
+    Recursively yield the paths of all STL files below a directory.
+
+    Uses os.scandir, whose entries already carry the file name and type, so no extra stat() call
+    is made per file and only matching files are wrapped in a Path. Directories that cannot be
+    listed are logged and skipped.
+    """
+    try:
+        entries = os.scandir(root)
+    except OSError as e:
+        # Skip directories that cannot be listed, as os.walk does
+        logging.warning(f"Skipping directory that cannot be read: {root} ({e})")
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_stl_files(entry.path)
+            elif entry.name.lower().endswith('.stl'):
+                yield Path(entry.path)
+
+
+def _init_worker(log_queue):
+    """Send the log records of a pool worker through a queue to the main process, which writes the log file."""
+    root_logger = logging.getLogger()
+    root_logger.handlers[:] = [QueueHandler(log_queue)]
+    root_logger.setLevel(logging.INFO)
+
+
+def _preview_worker(task):
+    """Unpack a (stl_path, image_size) task for use with Pool.imap_unordered."""
+    return create_3d_preview(*task)
+
+
+def main():
+    """Generate the STL checklist for the folder given on the command line (or entered by the user)."""
+    # Create logs directory if it doesn't exist
+    logs_dir = Path("logs")
+    logs_dir.mkdir(exist_ok=True)
+
+    # Check if the user provided the STL directory as a command-line argument
+    if len(sys.argv) > 1:
+        stls_dir = Path(sys.argv[1])
     else:
-        # Log missing preview and add entry to missing list with full path
-        missing_info = f"{folder}/{stl_path.name}"
-        missing_previews.append(missing_info)
-
-        # Add a row in the main table even if preview is missing
-        row = [
-            stl_path.name,
-            "Preview Missing",  # Indicate that the preview is missing
-            "",  # Placeholder for "Checked and Available"
-            "",  # Placeholder for "Not Needed"
-        ]
-        ws.append(row)
-
-        # Set the row height to 20 for rows without images
-        ws.row_dimensions[ws.max_row].height = 20
-
-# Insert missing previews information at the top of the sheet if any previews are missing
-if missing_previews:
-    ws.insert_rows(1)
-    ws.insert_rows(1)
-    ws["A1"] = "Warning: The following STL files failed to generate a preview:"
-    ws["A1"].font = Font(bold=True, color="FF0000")
-    for idx, missing_file in enumerate(missing_previews, start=2):
-        ws[f"A{idx}"] = missing_file
-    log_messages.append(f"{len(missing_previews)} STL previews failed to generate.")
-
-# Save the Excel file
-excel_output_path = Path.cwd() / "STL_Checklist_Structured.xlsx"
-wb.save(excel_output_path)
-log_messages.append(f"Checklist successfully saved at: {excel_output_path}")
-
-# Clean up the temporary directory
-shutil.rmtree(temp_dir)
-log_messages.append(f"Temporary previews deleted from: {temp_dir}")
-
-# Write the log messages to a log file with a timestamp
-timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-log_file_path = logs_dir / f"PRINTCHECK_log_{timestamp}.txt"
-with open(log_file_path, 'w') as log_file:
-    log_file.write("\n".join(log_messages))
-
-# Display summary to the user
-if missing_previews:
-    print(f"{len(missing_previews)} STL previews could not be created. See {log_file_path} for details.")
-else:
-    print(f"All STL previews were created successfully. See {log_file_path} for details.")
+        # Prompt the user to enter the path if not provided
+        stls_dir = Path(input("Please enter the path to the folder containing the STL files: "))
+
+    # Check if the provided path is valid
+    if not stls_dir.is_dir():
+        print(f"The specified path '{stls_dir}' is not a valid directory. Exiting.")
+        sys.exit(1)
+
+    # Write log messages to a timestamped log file as they happen
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    log_file_path = logs_dir / f"PRINTCHECK_log_{timestamp}.txt"
+    logging.basicConfig(filename=log_file_path, level=logging.INFO, format='%(asctime)s %(message)s')
+
+    # Gather all STL files in the specified 'Stls' directory and its subdirectories
+    stl_files = list(iter_stl_files(stls_dir))
+
+    # Sort once into folder order on a precomputed key: folder parts case-insensitively (with the exact parts
+    # as tie-breaker, so folders differing only in case stay separate), then the file name, also
+    # case-insensitively with the exact name as tie-breaker, so the order never depends on the filesystem
+    stl_files.sort(
+        key=lambda p: (tuple(part.lower() for part in p.parent.parts), p.parent.parts, p.name.lower(), p.name)
+    )
+
+    # Cache the folder of each parent directory relative to 'Stls' directory, as it is shared by all its files
+    folder_cache = {}
+
+    def folder_of(stl_path):
+        parent = stl_path.parent
+        if parent not in folder_cache:
+            folder_cache[parent] = parent.relative_to(stls_dir)
+        return folder_cache[parent]
+
+    logging.info(f"Found {len(stl_files)} STL files in '{stls_dir}'.")
+    print(f"Processing {len(stl_files)} STL files...")
+
+    tasks = [(stl_path, (200, 200)) for stl_path in stl_files]
+
+    # Render the previews in parallel, one worker process per CPU core, keeping the encoded images in memory,
+    # while the workers' log records are written to the log file by a listener in this process
+    preview_results = {}
+    log_queue = Queue()
+    log_listener = QueueListener(log_queue, *logging.getLogger().handlers)
+    log_listener.start()
+    with Pool(processes=os.cpu_count(), initializer=_init_worker, initargs=(log_queue,)) as pool:
+        for stl_path, jpeg_bytes in tqdm(
+            pool.imap_unordered(_preview_worker, tasks, chunksize=4),
+            total=len(tasks), desc="Processing STL files", unit="file",
+        ):
+            preview_results[stl_path] = jpeg_bytes
+        # Let the workers exit normally, so they release their renderers
+        pool.close()
+        pool.join()
+    log_listener.stop()
+
+    # List the missing previews with their relative folder up front, as the warning goes above the table
+    missing_previews = [
+        f"{folder_of(stl_path)}/{stl_path.name}"
+        for stl_path in stl_files
+        if preview_results[stl_path] is None
+    ]
+
+    # Initialize Excel workbook in constant memory mode, so each row is flushed to disk once it is complete
+    excel_output_path = Path.cwd() / "STL_Checklist_Structured.xlsx"
+    wb = xlsxwriter.Workbook(str(excel_output_path), {'constant_memory': True})
+    ws = wb.add_worksheet("STL Checklist")
+    bold = wb.add_format(BOLD)
+    red_bold = wb.add_format(RED_BOLD)
+
+    # Adjust column widths
+    ws.set_column('A:A', 30)
+    ws.set_column('B:B', 30)
+    ws.set_column('C:C', 20)
+    ws.set_column('D:D', 15)
+
+    # Index of the next row, as constant memory mode requires writing rows from top to bottom
+    current_row = 0
+
+    # Add missing previews information at the top of the sheet if any previews are missing
+    if missing_previews:
+        ws.write(current_row, 0, "Warning: The following STL files failed to generate a preview:", red_bold)
+        current_row += 1
+        for missing_file in missing_previews:
+            ws.write(current_row, 0, missing_file)
+            current_row += 1
+        logging.info(f"{len(missing_previews)} STL previews failed to generate.")
+
+    # Set bold headers
+    ws.write_row(current_row, 0, ["Filename", "Preview", "Checked and Available", "Not Needed"], bold)
+    current_row += 1
+
+    # Track the current folder to add section headers
+    current_folder = None
+
+    # Add the results to the sheet in folder order
+    for stl_path in stl_files:
+        # Determine the folder structure relative to 'Stls' directory
+        folder = folder_of(stl_path)
+
+        # Add a new header for each folder if it changes
+        if folder != current_folder:
+            # Insert a blank row for spacing before new folder
+            current_row += 1
+
+            # Add folder header row
+            ws.write(current_row, 0, f"Folder: {folder}", bold)
+            current_row += 1
+
+            current_folder = folder
+
+        jpeg_bytes = preview_results[stl_path]
+
+        if jpeg_bytes is not None:
+            # Set the row height to 150 for rows with images
+            ws.set_row(current_row, PREVIEW_ROW_HEIGHT)
+
+            # Add filename and placeholders for checkboxes
+            row = [
+                stl_path.name,
+                "",  # Placeholder for the image
+                "",  # Placeholder for "Checked and Available"
+                "",  # Placeholder for "Not Needed"
+            ]
+            ws.write_row(current_row, 0, row)
+
+            # Insert preview image into the Excel sheet (Column B, current row), already rendered at 200x200 pixels
+            ws.insert_image(current_row, 1, f"{stl_path.name}.jpg", {'image_data': BytesIO(jpeg_bytes)})
+        else:
+            # Set the row height to 20 for rows without images
+            ws.set_row(current_row, MISSING_ROW_HEIGHT)
+
+            # Add a row in the main table even if preview is missing
+            row = [
+                stl_path.name,
+                "Preview Missing",  # Indicate that the preview is missing
+                "",  # Placeholder for "Checked and Available"
+                "",  # Placeholder for "Not Needed"
+            ]
+            ws.write_row(current_row, 0, row)
+        current_row += 1
+
+    # Save the Excel file
+    wb.close()
+    logging.info(f"Checklist successfully saved at: {excel_output_path}")
+
+    # Display summary to the user
+    if missing_previews:
+        print(f"{len(missing_previews)} STL previews could not be created. See {log_file_path} for details.")
+    else:
+        print(f"All STL previews were created successfully. See {log_file_path} for details.")
+
+
+if __name__ == "__main__":
+    main()